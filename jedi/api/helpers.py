@@ -50,6 +50,9 @@ def sorted_definitions(defs):
                                        x.name))
 
 
+_completion_name_pattern = re.compile(r'(?!\d)\w+$|$')
+
+
 def get_on_completion_name(module_node, lines, position):
     leaf = module_node.get_leaf_for_position(position)
     if leaf is None or leaf.type in ('string', 'error_leaf'):
@@ -57,7 +60,7 @@ def get_on_completion_name(module_node, lines, position):
         # string. The same is true for comments and error_leafs.
         line = lines[position[0] - 1]
         # The first step of completions is to get the name
-        return re.search(r'(?!\d)\w+$|$', line[:position[1]]).group(0)
+        return _completion_name_pattern.search(line[:position[1]]).group(0)
     elif leaf.type not in ('name', 'keyword'):
         return ''
 
@@ -4,8 +4,10 @@
 from jedi.inference.compiled.value import CompiledValue, CompiledName, \
     CompiledValueFilter, CompiledValueName, create_from_access_path
 from jedi.inference.base_value import LazyValueWrapper
+from jedi.inference.cache import inference_state_function_cache
 
 
+@inference_state_function_cache()
 def builtin_from_name(inference_state, string):
     typing_builtins_module = inference_state.builtins_module
     if string in ('None', 'True', 'False'):
@@ -222,6 +222,19 @@ def resolve_forward_references(context, all_annotations):
     return {name: resolve(node) for name, node in all_annotations.items()}
 
 
+@inference_state_method_cache()
+def _get_resolved_annotations(function):
+    """
+    The annotations of a function with forward references already resolved.
+    They don't depend on the arguments, so they are cached per function and
+    not per execution.
+    """
+    return resolve_forward_references(
+        function.get_default_param_context(),
+        py__annotations__(function.tree_node),
+    )
+
+
 @inference_state_method_cache()
 def infer_return_types(function, arguments):
     """
@@ -229,10 +242,7 @@ def infer_return_types(function, arguments):
     according to type annotations.
     """
     context = function.get_default_param_context()
-    all_annotations = resolve_forward_references(
-        context,
-        py__annotations__(function.tree_node),
-    )
+    all_annotations = _get_resolved_annotations(function)
     annotation = all_annotations.get("return", None)
     if annotation is None:
         # If there is no Python 3-type annotation, look for an annotation
@@ -7,6 +7,8 @@ from contextlib import contextmanager
 
 from parso.python import tree
 
+from jedi.inference.cache import inference_state_function_cache
+
 
 def is_stdlib_path(path):
     # Python standard library paths look like this:
@@ -187,6 +189,7 @@ def parse_dotted_names(nodes, is_import_from, until_node=None):
     return level, names
 
 
+@inference_state_function_cache()
 def values_from_qualified_names(inference_state, *names):
     return inference_state.import_module(names[:-1]).py__getattribute__(names[-1])
 
@@ -553,14 +553,18 @@ def follow_error_node_imports_if_possible(context, name):
     if error_node is not None:
         # Get the first command start of a started simple_stmt. The error
         # node is sometimes a small_stmt and sometimes a simple_stmt. Check
-        # for ; leaves that start a new statements.
+        # for ; leaves that start a new statements. Search backwards from
+        # the name's child for the last ;.
+        children = error_node.children
+        node = name
+        while node.parent is not error_node:
+            node = node.parent
         start_index = 0
-        for index, n in enumerate(error_node.children):
-            if n.start_pos > name.start_pos:
-                break
-            if n == ';':
+        for index in range(children.index(node) - 1, -1, -1):
+            if children[index] == ';':
                 start_index = index + 1
-        nodes = error_node.children[start_index:]
+                break
+        nodes = children[start_index:]
         first_name = nodes[0].get_first_leaf().value
 
         # Make it possible to infer stuff like `import foo.` or
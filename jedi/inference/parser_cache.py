@@ -4,3 +4,34 @@ from jedi.inference.cache import inference_state_function_cache
 @inference_state_function_cache()
 def get_yield_exprs(inference_state, funcdef):
     return list(funcdef.iter_yield_exprs())
+
+
+@inference_state_function_cache()
+def get_yield_exprs_with_flow_parents(inference_state, funcdef):
+    """
+    Returns tuples of yield expressions and their closest ``for_stmt``,
+    ``while_stmt`` or ``if_stmt`` (or the function itself if there is none).
+
+    This walks the function only once instead of searching the ancestors of
+    every yield separately.
+    """
+    def scan(children, flow_parent):
+        for element in children:
+            if element.type in ('classdef', 'funcdef', 'lambdef'):
+                continue
+
+            try:
+                nested_children = element.children
+            except AttributeError:
+                if element.value == 'yield':
+                    if element.parent.type == 'yield_expr':
+                        yield element.parent, flow_parent
+                    else:
+                        yield element, flow_parent
+            else:
+                if element.type in ('for_stmt', 'while_stmt', 'if_stmt'):
+                    yield from scan(nested_children, element)
+                else:
+                    yield from scan(nested_children, flow_parent)
+
+    return list(scan(funcdef.children, funcdef))
@@ -106,8 +106,11 @@ class TreeSignature(AbstractSignature):
         if issues:
             return False
 
-        matches = all(executed_param_name.matches_signature()
-                      for executed_param_name in executed_param_names)
+        matches = True
+        for executed_param_name in executed_param_names:
+            if not executed_param_name.matches_signature():
+                matches = False
+                break
         if debug.enable_notice:
             tree_node = self._function_value.tree_node
             signature = parser_utils.get_signature(tree_node)
@@ -29,6 +29,8 @@ from jedi.inference.helpers import infer_call_of_leaf
 from jedi.inference.cache import inference_state_method_cache
 
 _sentinel = object()
+_LIST_ADDITION_NAMES = ('append', 'extend', 'insert')
+_SET_ADDITION_NAMES = ('add', 'update')
 
 
 def check_array_additions(context, sequence):
@@ -37,6 +39,16 @@ def check_array_additions(context, sequence):
         # TODO also check for dict updates
         return NO_VALUES
 
+    module_context = context.get_root_context()
+    if not module_context.is_compiled():
+        # This only saves work in modules that don't use any of the addition
+        # method names at all, there the search can be skipped.
+        used_names = module_context.tree_node.get_used_names()
+        search_names = _LIST_ADDITION_NAMES if sequence.array_type == 'list' \
+            else _SET_ADDITION_NAMES
+        if not any(name in used_names for name in search_names):
+            return NO_VALUES
+
     return _internal_check_array_additions(context, sequence)
 
 
@@ -74,48 +86,47 @@ def _internal_check_array_additions(context, sequence):
         settings.dynamic_params_for_other_modules, False
 
     is_list = sequence.name.string_name == 'list'
-    search_names = (['append', 'extend', 'insert'] if is_list else ['add', 'update'])
+    search_names = _LIST_ADDITION_NAMES if is_list else _SET_ADDITION_NAMES
 
     added_types = set()
+    used_names = module_context.tree_node.get_used_names()
+    value_node = context.tree_node
     for add_name in search_names:
-        try:
-            possible_names = module_context.tree_node.get_used_names()[add_name]
-        except KeyError:
+        possible_names = used_names.get(add_name)
+        if not possible_names:
             continue
-        else:
-            for name in possible_names:
-                value_node = context.tree_node
-                if not (value_node.start_pos < name.start_pos < value_node.end_pos):
-                    continue
-                trailer = name.parent
-                power = trailer.parent
-                trailer_pos = power.children.index(trailer)
-                try:
-                    execution_trailer = power.children[trailer_pos + 1]
-                except IndexError:
+        for name in possible_names:
+            if not (value_node.start_pos < name.start_pos < value_node.end_pos):
+                continue
+            trailer = name.parent
+            power = trailer.parent
+            trailer_pos = power.children.index(trailer)
+            try:
+                execution_trailer = power.children[trailer_pos + 1]
+            except IndexError:
+                continue
+            else:
+                if execution_trailer.type != 'trailer' \
+                        or execution_trailer.children[0] != '(' \
+                        or execution_trailer.children[1] == ')':
                     continue
-                else:
-                    if execution_trailer.type != 'trailer' \
-                            or execution_trailer.children[0] != '(' \
-                            or execution_trailer.children[1] == ')':
-                        continue
-
-                random_context = context.create_context(name)
 
-                with recursion.execution_allowed(context.inference_state, power) as allowed:
-                    if allowed:
-                        found = infer_call_of_leaf(
+            random_context = context.create_context(name)
+
+            with recursion.execution_allowed(context.inference_state, power) as allowed:
+                if allowed:
+                    found = infer_call_of_leaf(
+                        random_context,
+                        name,
+                        cut_own_trailer=True
+                    )
+                    if sequence in found:
+                        # The arrays match. Now add the results
+                        added_types |= find_additions(
                             random_context,
-                            name,
-                            cut_own_trailer=True
+                            execution_trailer.children[1],
+                            add_name
                         )
-                        if sequence in found:
-                            # The arrays match. Now add the results
-                            added_types |= find_additions(
-                                random_context,
-                                execution_trailer.children[1],
-                                add_name
-                            )
 
     # reset settings
     settings.dynamic_params_for_other_modules = temp_param_add
@@ -1,5 +1,3 @@
-from parso.python import tree
-
 from jedi import debug
 from jedi.inference.cache import inference_state_method_cache, CachedMetaClass
 from jedi.inference import compiled
@@ -18,7 +16,8 @@ from jedi.inference.lazy_value import LazyKnownValues, LazyKnownValue, \
 from jedi.inference.context import ValueContext, TreeContextMixin
 from jedi.inference.value import iterable
 from jedi import parser_utils
-from jedi.inference.parser_cache import get_yield_exprs
+from jedi.inference.parser_cache import get_yield_exprs, \
+    get_yield_exprs_with_flow_parents
 from jedi.inference.helpers import values_from_qualified_names
 from jedi.inference.gradual.generics import TupleGenericManager
 
@@ -30,16 +29,18 @@ class LambdaName(AbstractNameDefinition):
     def __init__(self, lambda_value):
         self._lambda_value = lambda_value
         self.parent_context = lambda_value.parent_context
+        self._inferred = ValueSet([lambda_value])
 
     @property
     def start_pos(self):
         return self._lambda_value.tree_node.start_pos
 
     def infer(self):
-        return ValueSet([self._lambda_value])
+        return self._inferred
 
 
 class FunctionAndClassBase(TreeValue):
+    @inference_state_method_cache()
     def get_qualified_names(self):
         if self.parent_context.is_class():
             n = self.parent_context.get_qualified_names()
@@ -72,7 +73,8 @@ class FunctionMixin:
         return [AnonymousParamName(self, param.name)
                 for param in self.tree_node.get_params()]
 
-    @property
+    @property  # type: ignore[misc]
+    @inference_state_method_cache()
     def name(self):
         if self.tree_node.type == 'lambdef':
             return LambdaName(self)
@@ -120,6 +122,7 @@ class FunctionMixin:
             return AnonymousFunctionExecution(self)
         return FunctionExecutionContext(self, arguments)
 
+    @inference_state_method_cache()
     def get_signatures(self):
         return [TreeSignature(f) for f in self.get_signature_functions()]
 
@@ -186,6 +189,7 @@ class MethodValue(FunctionValue):
     def get_default_param_context(self):
         return self.class_context
 
+    @inference_state_method_cache()
     def get_qualified_names(self):
         # Need to implement this, because the parent value of a method
         # value is not the class value but the module.
@@ -194,7 +198,8 @@ class MethodValue(FunctionValue):
             return None
         return names + (self.py__name__(),)
 
-    @property
+    @property  # type: ignore[misc]
+    @inference_state_method_cache()
     def name(self):
         return FunctionNameInClass(self.class_context, super().name)
 
@@ -233,13 +238,12 @@ class BaseFunctionExecutionContext(ValueContext, TreeContextMixin):
                 if check is flow_analysis.UNREACHABLE:
                     debug.dbg('Return unreachable: %s', r)
                 else:
-                    try:
-                        children = r.children
-                    except AttributeError:
+                    if r.type == 'keyword':
+                        # A bare `return` returns None.
                         ctx = compiled.builtin_from_name(self.inference_state, 'None')
                         value_set |= ValueSet([ctx])
                     else:
-                        value_set |= self.infer_node(children[1])
+                        value_set |= self.infer_node(r.children[1])
                 if check is flow_analysis.REACHABLE:
                     debug.dbg('Return reachable: %s', r)
                     break
@@ -262,9 +266,7 @@ class BaseFunctionExecutionContext(ValueContext, TreeContextMixin):
     @recursion.execution_recursion_decorator(default=iter([]))
     def get_yield_lazy_values(self, is_async=False):
         # TODO: if is_async, wrap yield statements in Awaitable/async_generator_asend
-        for_parents = [(y, tree.search_ancestor(y, 'for_stmt', 'funcdef',
-                                                'while_stmt', 'if_stmt'))
-                       for y in get_yield_exprs(self.inference_state, self.tree_node)]
+        for_parents = get_yield_exprs_with_flow_parents(self.inference_state, self.tree_node)
 
         # Calculate if the yields are placed within the same for loop.
         yields_order = []
@@ -399,17 +401,18 @@ class OverloadedFunctionValue(FunctionMixin, ValueWrapper):
 
     def py__call__(self, arguments):
         debug.dbg("Execute overloaded function %s", self._wrapped_value, color='BLUE')
-        function_executions = []
-        for signature in self.get_signatures():
-            function_execution = signature.value.as_context(arguments)
-            function_executions.append(function_execution)
+        signatures = self.get_signatures()
+        for signature in signatures:
             if signature.matches_signature(arguments):
-                return function_execution.infer()
+                return signature.value.as_context(arguments).infer()
 
         if self.inference_state.is_analysis:
             # In this case we want precision.
             return NO_VALUES
-        return ValueSet.from_sets(fe.infer() for fe in function_executions)
+        return ValueSet.from_sets(
+            signature.value.as_context(arguments).infer()
+            for signature in signatures
+        )
 
     def get_signature_functions(self):
         return self._overloaded_functions
@@ -418,21 +421,23 @@ class OverloadedFunctionValue(FunctionMixin, ValueWrapper):
         return 'Union[%s]' % ', '.join(f.get_type_hint() for f in self._overloaded_functions)
 
 
-def _find_overload_functions(context, tree_node):
-    def _is_overload_decorated(funcdef):
-        if funcdef.parent.type == 'decorated':
-            decorators = funcdef.parent.children[0]
-            if decorators.type == 'decorator':
-                decorators = [decorators]
-            else:
-                decorators = decorators.children
-            for decorator in decorators:
-                dotted_name = decorator.children[1]
-                if dotted_name.type == 'name' and dotted_name.value == 'overload':
-                    # TODO check with values if it's the right overload
-                    return True
-        return False
+def _is_overload_decorated(funcdef):
+    parent = funcdef.parent
+    if parent.type == 'decorated':
+        decorators = parent.children[0]
+        if decorators.type == 'decorator':
+            decorators = (decorators,)
+        else:
+            decorators = decorators.children
+        for decorator in decorators:
+            dotted_name = decorator.children[1]
+            if dotted_name.type == 'name' and dotted_name.value == 'overload':
+                # TODO check with values if it's the right overload
+                return True
+    return False
 
+
+def _find_overload_functions(context, tree_node):
     if tree_node.type == 'lambdef':
         return
 
@@ -28,9 +28,10 @@ class InstanceExecutedParamName(ParamName):
         super().__init__(
             function_value, tree_name, arguments=None)
         self._instance = instance
+        self._inferred = ValueSet([instance])
 
     def infer(self):
-        return ValueSet([self._instance])
+        return self._inferred
 
     def matches_signature(self):
         return True
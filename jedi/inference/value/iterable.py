@@ -8,8 +8,9 @@ from jedi.inference.lazy_value import LazyKnownValue, LazyKnownValues, \
     LazyTreeValue
 from jedi.inference.helpers import get_int_or_none, is_string, \
     reraise_getitem_errors, SimpleGetItemNotFound
-from jedi.inference.utils import safe_property, to_list
-from jedi.inference.cache import inference_state_method_cache
+from jedi.inference.utils import safe_property
+from jedi.inference.cache import inference_state_method_cache, \
+    inference_state_function_cache
 from jedi.inference.filters import LazyAttributeOverwrite, publish_method
 from jedi.inference.base_value import ValueSet, Value, NO_VALUES, \
     ContextualizedNode, iterate_values, sentinel, \
@@ -19,12 +20,26 @@ from jedi.inference.context import CompForContext
 from jedi.inference.value.dynamic_arrays import check_array_additions
 
 
+@inference_state_function_cache()
+def _get_none_value_set(inference_state):
+    return ValueSet([compiled.builtin_from_name(inference_state, 'None')])
+
+
 class IterableMixin:
+    _self_value_set = None
+
+    def _as_value_set(self):
+        # Iterables return themselves quite often (e.g. for `__iter__` or
+        # slices), so the set is only created once.
+        if self._self_value_set is None:
+            self._self_value_set = ValueSet([self])
+        return self._self_value_set
+
     def py__next__(self, contextualized_node=None):
         return self.py__iter__(contextualized_node)
 
     def py__stop_iteration_returns(self):
-        return ValueSet([compiled.builtin_from_name(self.inference_state, 'None')])
+        return _get_none_value_set(self.inference_state)
 
     # At the moment, safe values are simple values like "foo", 1 and not
     # lists/dicts. Therefore as a small speed optimization we can just do the
@@ -51,7 +66,7 @@ class GeneratorBase(LazyAttributeOverwrite, IterableMixin):
 
     @publish_method('__iter__')
     def _iter(self, arguments):
-        return ValueSet([self])
+        return self._as_value_set()
 
     @publish_method('send')
     @publish_method('__next__')
@@ -59,7 +74,7 @@ class GeneratorBase(LazyAttributeOverwrite, IterableMixin):
         return ValueSet.from_sets(lazy_value.infer() for lazy_value in self.py__iter__())
 
     def py__stop_iteration_returns(self):
-        return ValueSet([compiled.builtin_from_name(self.inference_state, 'None')])
+        return _get_none_value_set(self.inference_state)
 
     @property
     def name(self):
@@ -91,7 +106,12 @@ class Generator(GeneratorBase):
         return "<%s of %s>" % (type(self).__name__, self._func_execution_context)
 
 
-def comprehension_from_atom(inference_state, value, atom):
+@inference_state_function_cache()
+def _get_comprehension_nodes(inference_state, atom):
+    """
+    Returns the comprehension class and the nodes it's created from. This only
+    depends on the tree, so it can be cached per atom.
+    """
     bracket = atom.children[0]
     test_list_comp = atom.children[1]
 
@@ -101,12 +121,10 @@ def comprehension_from_atom(inference_state, value, atom):
             if sync_comp_for.type == 'comp_for':
                 sync_comp_for = sync_comp_for.children[1]
 
-            return DictComprehension(
-                inference_state,
-                value,
-                sync_comp_for_node=sync_comp_for,
-                key_node=test_list_comp.children[0],
-                value_node=test_list_comp.children[2],
+            return (
+                DictComprehension,
+                sync_comp_for,
+                (test_list_comp.children[0], test_list_comp.children[2]),
             )
         else:
             cls = SetComprehension
@@ -119,15 +137,19 @@ def comprehension_from_atom(inference_state, value, atom):
     if sync_comp_for.type == 'comp_for':
         sync_comp_for = sync_comp_for.children[1]
 
-    return cls(
-        inference_state,
-        defining_context=value,
-        sync_comp_for_node=sync_comp_for,
-        entry_node=test_list_comp.children[0],
-    )
+    return cls, sync_comp_for, (test_list_comp.children[0],)
+
+
+def comprehension_from_atom(inference_state, value, atom):
+    cls, sync_comp_for, nodes = _get_comprehension_nodes(inference_state, atom)
+    # The nodes are either the entry node or the key and value nodes of a
+    # dict comprehension.
+    return cls(inference_state, value, sync_comp_for, *nodes)
 
 
 class ComprehensionMixin:
+    _iterate_cache = None
+
     @inference_state_method_cache()
     def _get_comp_for_context(self, parent_context, comp_for):
         return CompForContext(parent_context, comp_for)
@@ -144,7 +166,9 @@ class ComprehensionMixin:
         cn = ContextualizedNode(parent_context, input_node)
         iterated = input_types.iterate(cn, is_async=is_async)
         exprlist = comp_for.children[1]
-        for i, lazy_value in enumerate(iterated):
+        is_innermost = len(comp_fors) == 1
+        is_dict = self.array_type == 'dict'
+        for lazy_value in iterated:
             types = lazy_value.infer()
             dct = unpack_tuple_to_dict(parent_context, types, exprlist)
             context = self._get_comp_for_context(
@@ -152,18 +176,26 @@ class ComprehensionMixin:
                 comp_for,
             )
             with context.predefine_names(comp_for, dct):
-                try:
+                if not is_innermost:
                     yield from self._nested(comp_fors[1:], context)
-                except IndexError:
-                    iterated = context.infer_node(self._entry_node)
-                    if self.array_type == 'dict':
-                        yield iterated, context.infer_node(self._value_node)
-                    else:
-                        yield iterated
+                elif is_dict:
+                    yield (
+                        context.infer_node(self._entry_node),
+                        context.infer_node(self._value_node),
+                    )
+                else:
+                    yield context.infer_node(self._entry_node)
 
-    @inference_state_method_cache(default=[])
-    @to_list
     def _iterate(self):
+        if self._iterate_cache is None:
+            # Set the empty list first, so recursive calls return it instead
+            # of recursing infinitely (like the default of the inference
+            # state cache).
+            self._iterate_cache = []
+            self._iterate_cache = list(self._gen_iterate())
+        return self._iterate_cache
+
+    def _gen_iterate(self):
         comp_fors = tuple(get_sync_comp_fors(self._sync_comp_for_node))
         yield from self._nested(comp_fors)
 
@@ -214,7 +246,7 @@ class Sequence(LazyAttributeOverwrite, IterableMixin):
     def py__getitem__(self, index_value_set, contextualized_node):
         if self.array_type == 'dict':
             return self._dict_values()
-        return iterate_values(ValueSet([self]))
+        return iterate_values(self._as_value_set())
 
 
 class _BaseComprehension(ComprehensionMixin):
@@ -231,7 +263,7 @@ class ListComprehension(_BaseComprehension, Sequence):
 
     def py__simple_getitem__(self, index):
         if isinstance(index, slice):
-            return ValueSet([self])
+            return self._as_value_set()
 
         all_types = list(self.py__iter__())
         with reraise_getitem_errors(IndexError, TypeError):
@@ -259,6 +291,7 @@ class _DictKeyMixin:
 
 class DictComprehension(ComprehensionMixin, Sequence, _DictKeyMixin):
     array_type = 'dict'
+    _dict_keys_and_values = None
 
     def __init__(self, inference_state, defining_context, sync_comp_for_node, key_node, value_node):
         assert sync_comp_for_node.type == 'sync_comp_for'
@@ -281,11 +314,28 @@ class DictComprehension(ComprehensionMixin, Sequence, _DictKeyMixin):
                     return values
         raise SimpleGetItemNotFound()
 
+    def _iterate(self):
+        if self._iterate_cache is None:
+            iterated = super()._iterate()
+            # Merge the keys and values once the final result is known.
+            self._dict_keys_and_values = (
+                ValueSet.from_sets(keys for keys, values in iterated),
+                ValueSet.from_sets(values for keys, values in iterated),
+            )
+        return self._iterate_cache
+
+    def _get_dict_keys_and_values(self):
+        self._iterate()
+        # While ``_iterate`` is recursing there are no keys and values yet.
+        return self._dict_keys_and_values or (NO_VALUES, NO_VALUES)
+
     def _dict_keys(self):
-        return ValueSet.from_sets(keys for keys, values in self._iterate())
+        keys, values = self._get_dict_keys_and_values()
+        return keys
 
     def _dict_values(self):
-        return ValueSet.from_sets(values for keys, values in self._iterate())
+        keys, values = self._get_dict_keys_and_values()
+        return values
 
     @publish_method('values')
     def _imitate_values(self, arguments):
@@ -318,6 +368,7 @@ class SequenceLiteralValue(Sequence):
     mapping = {'(': 'tuple',
                '[': 'list',
                '{': 'set'}
+    _tree_entries = None
 
     def __init__(self, inference_state, defining_context, atom):
         super().__init__(inference_state)
@@ -326,6 +377,7 @@ class SequenceLiteralValue(Sequence):
 
         if self.atom.type in self._TUPLE_LIKE:
             self.array_type = 'tuple'
+            self._tree_entries = atom.children[::2]
         else:
             self.array_type = SequenceLiteralValue.mapping[atom.children[0]]
             """The builtin name of the array (list, set, tuple or dict)."""
@@ -338,7 +390,7 @@ class SequenceLiteralValue(Sequence):
     def py__simple_getitem__(self, index):
         """Here the index is an int/str. Raises IndexError/KeyError."""
         if isinstance(index, slice):
-            return ValueSet([self])
+            return self._as_value_set()
         else:
             with reraise_getitem_errors(TypeError, KeyError, IndexError):
                 node = self.get_tree_entries()[index]
@@ -358,19 +410,23 @@ class SequenceLiteralValue(Sequence):
                 yield LazyKnownValue(Slice(self._defining_context, None, None, None))
             else:
                 yield LazyTreeValue(self._defining_context, node)
-        yield from check_array_additions(self._defining_context, self)
+        if self.array_type != 'tuple':
+            # Tuples are immutable, there can't be any additions.
+            yield from check_array_additions(self._defining_context, self)
 
     def py__len__(self):
         # This function is not really used often. It's more of a try.
         return len(self.get_tree_entries())
 
     def get_tree_entries(self):
-        c = self.atom.children
-
-        if self.atom.type in self._TUPLE_LIKE:
-            return c[::2]
-
-        array_node = c[1]
+        # The parser tree doesn't change, so the entries are only calculated
+        # once per value.
+        if self._tree_entries is None:
+            self._tree_entries = self._calculate_tree_entries()
+        return self._tree_entries
+
+    def _calculate_tree_entries(self):
+        array_node = self.atom.children[1]
         if array_node in (']', '}', ')'):
             return []  # Direct closing bracket, doesn't contain items.
 
@@ -413,8 +469,12 @@ class SequenceLiteralValue(Sequence):
         return "<%s of %s>" % (self.__class__.__name__, self.atom)
 
 
+_CONSTANT_KEY_TYPES = (str, bytes, int, float)
+
+
 class DictLiteralValue(_DictMixin, SequenceLiteralValue, _DictKeyMixin):
     array_type = 'dict'
+    _key_index = None
 
     def __init__(self, inference_state, defining_context, atom):
         # Intentionally don't call the super class. This is definitely a sign
@@ -423,14 +483,57 @@ class DictLiteralValue(_DictMixin, SequenceLiteralValue, _DictKeyMixin):
         self._defining_context = defining_context
         self.atom = atom
 
+    def _get_key_index(self):
+        """
+        Returns a dict that maps constant keys (strings, numbers) to the
+        position of their first entry and a list of the positions of all other
+        entries. Dicts with literal keys are often used as lookup tables, this
+        avoids comparing the index with every key.
+        """
+        if self._key_index is None:
+            constant_keys = {}
+            other_positions = []
+            for position, (key_node, _) in enumerate(self.get_tree_entries()):
+                safe_values = []
+                for key in self._defining_context.infer_node(key_node):
+                    safe_value = key.get_safe_value(default=None)
+                    if not isinstance(safe_value, _CONSTANT_KEY_TYPES):
+                        break
+                    safe_values.append(safe_value)
+                else:
+                    if safe_values:
+                        for safe_value in safe_values:
+                            constant_keys.setdefault(safe_value, position)
+                        continue
+                other_positions.append(position)
+            self._key_index = constant_keys, other_positions
+        return self._key_index
+
     def py__simple_getitem__(self, index):
         """Here the index is an int/str. Raises IndexError/KeyError."""
-        compiled_value_index = compiled.create_simple_object(self.inference_state, index)
-        for key, value in self.get_tree_entries():
-            for k in self._defining_context.infer_node(key):
-                for key_v in k.execute_operation(compiled_value_index, '=='):
-                    if key_v.get_safe_value():
-                        return self._defining_context.infer_node(value)
+        entries = self.get_tree_entries()
+        constant_keys, other_positions = self._get_key_index()
+        try:
+            found = constant_keys.get(index)
+        except TypeError:
+            # Unhashable indexes can never match a constant key.
+            found = None
+
+        # Keys that are not constant still need to be compared, but only if
+        # they appear before the constant key that was found.
+        if other_positions and (found is None or other_positions[0] < found):
+            compiled_value_index = compiled.create_simple_object(self.inference_state, index)
+            for position in other_positions:
+                if found is not None and position > found:
+                    break
+                key, value = entries[position]
+                for k in self._defining_context.infer_node(key):
+                    for key_v in k.execute_operation(compiled_value_index, '=='):
+                        if key_v.get_safe_value():
+                            return self._defining_context.infer_node(value)
+
+        if found is not None:
+            return self._defining_context.infer_node(entries[found][1])
         raise SimpleGetItemNotFound('No key found in dictionary %s.' % self)
 
     def py__iter__(self, contextualized_node=None):
@@ -444,8 +547,9 @@ class DictLiteralValue(_DictMixin, SequenceLiteralValue, _DictKeyMixin):
             types |= self._defining_context.infer_node(k)
         # We don't know which dict index comes first, therefore always
         # yield all the types.
+        lazy_value = LazyKnownValues(types)
         for _ in types:
-            yield LazyKnownValues(types)
+            yield lazy_value
 
     @publish_method('values')
     def _imitate_values(self, arguments):
@@ -497,7 +601,7 @@ class _FakeSequence(Sequence):
 
     def py__simple_getitem__(self, index):
         if isinstance(index, slice):
-            return ValueSet([self])
+            return self._as_value_set()
 
         with reraise_getitem_errors(IndexError, TypeError):
             lazy_value = self._lazy_value_list[index]
@@ -527,10 +631,15 @@ class FakeDict(_DictMixin, Sequence, _DictKeyMixin):
     def __init__(self, inference_state, dct):
         super().__init__(inference_state)
         self._dct = dct
+        self._lazy_keys = None
 
     def py__iter__(self, contextualized_node=None):
-        for key in self._dct:
-            yield LazyKnownValue(compiled.create_simple_object(self.inference_state, key))
+        if self._lazy_keys is None:
+            self._lazy_keys = tuple(
+                LazyKnownValue(compiled.create_simple_object(self.inference_state, key))
+                for key in self._dct
+            )
+        return iter(self._lazy_keys)
 
     def py__simple_getitem__(self, index):
         with reraise_getitem_errors(KeyError, TypeError):
@@ -562,25 +671,40 @@ class MergedArray(Sequence):
         super().__init__(inference_state)
         self.array_type = arrays[-1].array_type
         self._arrays = arrays
+        self._merged_values = None
 
     def py__iter__(self, contextualized_node=None):
         for array in self._arrays:
             yield from array.py__iter__()
 
     def py__simple_getitem__(self, index):
-        return ValueSet.from_sets(lazy_value.infer() for lazy_value in self.py__iter__())
+        # The index is ignored, any item could be any of the values, so they
+        # are only merged once.
+        if self._merged_values is None:
+            self._merged_values = ValueSet.from_sets(
+                lazy_value.infer() for lazy_value in self.py__iter__()
+            )
+        return self._merged_values
+
+
+_TUPLE_LIKE_TYPES = frozenset(['testlist', 'testlist_comp', 'exprlist', 'testlist_star_expr'])
+_UNSUPPORTED_UNPACKING_TYPES = frozenset(['power', 'atom_expr', 'star_expr'])
 
 
 def unpack_tuple_to_dict(context, types, exprlist):
     """
     Unpacking tuple assignments in for statements and expr_stmts.
     """
-    if exprlist.type == 'name':
+    type_ = exprlist.type
+    # Brackets around the targets don't change anything, unwrap them without
+    # recursing.
+    while type_ == 'atom' and exprlist.children[0] in ('(', '['):
+        exprlist = exprlist.children[1]
+        type_ = exprlist.type
+
+    if type_ == 'name':
         return {exprlist.value: types}
-    elif exprlist.type == 'atom' and exprlist.children[0] in ('(', '['):
-        return unpack_tuple_to_dict(context, types, exprlist.children[1])
-    elif exprlist.type in ('testlist', 'testlist_comp', 'exprlist',
-                           'testlist_star_expr'):
+    elif type_ in _TUPLE_LIKE_TYPES:
         dct = {}
         parts = iter(exprlist.children[::2])
         n = 0
@@ -598,14 +722,11 @@ def unpack_tuple_to_dict(context, types, exprlist):
             analysis.add(context, 'value-error-too-few-values', has_parts,
                          message="ValueError: need more than %s values to unpack" % n)
         return dct
-    elif exprlist.type == 'power' or exprlist.type == 'atom_expr':
-        # Something like ``arr[x], var = ...``.
+    elif type_ in _UNSUPPORTED_UNPACKING_TYPES:
+        # Something like ``arr[x], var = ...`` or ``a, *b, c = x``.
         # This is something that is not yet supported, would also be difficult
         # to write into a dict.
         return {}
-    elif exprlist.type == 'star_expr':  # `a, *b, c = x` type unpackings
-        # Currently we're not supporting them.
-        return {}
     raise NotImplementedError
 
 
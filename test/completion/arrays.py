@@ -263,6 +263,17 @@ dic2[r'as' 'd' u'f']
 #? int() str()
 dic2['just_something']
 
+# keys that are not constant
+def f():
+    return str()
+
+#? int()
+{f(): 1.0, 'x': 1}['x']
+#? int()
+{'x': 1, f(): 1.0}['x']
+#? int() float()
+{f(): 1.0, 'x': 1}['y']
+
 # unpacking
 a, b = dic2
 #? str()
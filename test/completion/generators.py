@@ -230,6 +230,11 @@ def x():
 #? int()
 next(x())
 
+g = lambda: (yield 1)
+for x in g():
+    #? int()
+    x
+
 # -----------------
 # statements
 # -----------------
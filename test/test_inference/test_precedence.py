@@ -6,8 +6,7 @@ import pytest
 @pytest.mark.parametrize('source', [
     pytest.param('1 == 1'),
     pytest.param('1.0 == 1'),
-    # Unfortunately for now not possible, because it's a typeshed object.
-    pytest.param('... == ...', marks=pytest.mark.xfail),
+    pytest.param('... == ...'),
 ])
 def test_equals(Script, environment, source):
     script = Script(source)